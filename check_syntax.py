@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""Basic syntax and interface checks for the CORDIC Verilog sources.
+
+Checks CORDIC.v and CORDIC_tb.v for balanced brackets, matched
+begin/end pairs, likely missing semicolons, and testbench port
+connectivity.  This is a lint-style sanity pass, not a full parser.
+"""
+
+import functools
+import mmap
+import os
+import re
+import sys
+
+# Patterns are compiled once at import time rather than on every call.
+_MODULE_PORTS_RE = re.compile(
+    r'module\s+CORDIC\s*(?:#\s*\(.*?\)\s*)?\((.*?)\);', re.DOTALL)
+_INLINE_COMMENT_RE = re.compile(r'//')
+_BIT_RANGE_RE = re.compile(r'\[[^\]]*\]')
+_IDENT_RE = re.compile(r'[A-Za-z_]\w*')
+
+# One alternation covering every token the file scan cares about,
+# including comment delimiters, so the whole file is checked in a single
+# left-to-right pass over the memory-mapped bytes.  Keywords make the
+# missing-semicolon heuristic keep quiet for a line; the trailing word
+# group catches any other code token so line endings can be judged.
+_TOKEN_RE = re.compile(
+    rb'(?P<bc_open>/\*)'
+    rb'|(?P<bc_close>\*/)'
+    rb'|(?P<line_comment>//)'
+    rb'|(?P<begin>\bbegin\b)'
+    rb'|(?P<end>\bend(?:module|case|generate)?\b)'
+    rb'|(?P<keyword>\b(?:reg|wire|input|output|parameter|localparam'
+    rb'|module|else|initial|always|case|if|for|while|generate)\b)'
+    rb'|(?P<bracket>[()\[\]{}])'
+    rb'|(?P<term>[;,:])'
+    rb'|(?P<word>\w+|[^\s])')
+
+# Line-ending tokens that satisfy the missing-semicolon heuristic.
+_LINE_END_OK = frozenset([b';', b',', b':', b'(', b')', b'begin', b'end'])
+
+
+@functools.lru_cache(maxsize=32)
+def _read_file_cached(path, mtime_ns, size):
+    with open(path) as f:
+        return f.read()
+
+
+def _read_file(path):
+    """Read *path*, reusing the cached copy while its mtime and size match.
+
+    Both checkers look at the same two files, and CI/watch loops rerun
+    the whole script; keying the cache on (path, mtime, size) makes the
+    repeat reads free without ever serving a stale file.
+    """
+    st = os.stat(path)
+    return _read_file_cached(path, st.st_mtime_ns, st.st_size)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_ports_cached(path, mtime_ns, size):
+    match = _MODULE_PORTS_RE.search(_read_file_cached(path, mtime_ns, size))
+    if not match:
+        return None
+
+    # Multi-bit port groups repeat names across lines; dedupe at
+    # construction and intern the survivors so later membership tests
+    # compare pointers rather than characters.
+    port_names = set()
+    for port_line in match.group(1).split('\n'):
+        port_line = _INLINE_COMMENT_RE.split(port_line, 1)[0].strip()
+        if not port_line:
+            continue
+        for port in port_line.split(','):
+            port = _BIT_RANGE_RE.sub('', port).strip()
+            if not port:
+                continue
+            port_name = port.split()[-1]
+            if port_name:
+                port_names.add(sys.intern(port_name))
+    return frozenset(port_names)
+
+
+def _parse_ports(path):
+    """Return the set of CORDIC port names from *path*, or None."""
+    st = os.stat(path)
+    return _parse_ports_cached(path, st.st_mtime_ns, st.st_size)
+
+
+def check_verilog_syntax(filename):
+    """Check one Verilog file; return (errors, warnings) lists of strings."""
+    errors = []
+    warnings = []
+
+    # Memory-map the file and tokenize it with one regex pass instead of
+    # materializing the text plus a per-line string list; line numbers
+    # come from counting newlines between consecutive token positions.
+    paren_count = 0
+    bracket_count = 0
+    brace_count = 0
+    begin_count = 0
+    end_count = 0
+    in_block_comment = False
+    in_line_comment = False
+    line_no = 1
+    prev = 0
+    last_tok = None       # last code token on the current line
+    has_keyword = False   # current line has a warning-suppressing keyword
+
+    try:
+        with open(filename, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return [], []
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                for m in _TOKEN_RE.finditer(mm):
+                    # mmap objects have no count(); the slice between
+                    # consecutive tokens is small, so counting its
+                    # newlines stays cheap.
+                    newlines = mm[prev:m.start()].count(b'\n')
+                    if newlines:
+                        if (last_tok is not None and not has_keyword
+                                and last_tok not in _LINE_END_OK):
+                            warnings.append(f"{filename}:{line_no}: "
+                                            "possible missing semicolon")
+                        line_no += newlines
+                        last_tok = None
+                        has_keyword = False
+                        in_line_comment = False
+                    prev = m.start()
+
+                    kind = m.lastgroup
+                    if in_block_comment:
+                        if kind == 'bc_close':
+                            in_block_comment = False
+                        continue
+                    if in_line_comment:
+                        continue
+                    if kind == 'bc_open':
+                        in_block_comment = True
+                        continue
+                    if kind == 'line_comment':
+                        in_line_comment = True
+                        continue
+
+                    tok = m.group()
+                    if kind == 'bracket':
+                        if tok == b'(':
+                            paren_count += 1
+                        elif tok == b')':
+                            paren_count -= 1
+                        elif tok == b'[':
+                            bracket_count += 1
+                        elif tok == b']':
+                            bracket_count -= 1
+                        elif tok == b'{':
+                            brace_count += 1
+                        else:
+                            brace_count -= 1
+                    elif kind == 'begin':
+                        begin_count += 1
+                    elif kind == 'end':
+                        if tok == b'end':
+                            end_count += 1
+                        else:
+                            has_keyword = True
+                    elif kind == 'keyword':
+                        has_keyword = True
+                    last_tok = tok
+
+                if (last_tok is not None and not has_keyword
+                        and last_tok not in _LINE_END_OK):
+                    warnings.append(f"{filename}:{line_no}: "
+                                    "possible missing semicolon")
+    except OSError as exc:
+        return [f"{filename}: cannot read file: {exc}"], []
+
+    if paren_count != 0:
+        errors.append(f"{filename}: unbalanced parentheses ({paren_count:+d})")
+    if bracket_count != 0:
+        errors.append(f"{filename}: unbalanced brackets ({bracket_count:+d})")
+    if brace_count != 0:
+        errors.append(f"{filename}: unbalanced braces ({brace_count:+d})")
+    if begin_count != end_count:
+        errors.append(f"{filename}: begin/end mismatch "
+                      f"({begin_count} begin, {end_count} end)")
+
+    return errors, warnings
+
+
+def check_module_interfaces():
+    """Check that every CORDIC port is referenced by the testbench."""
+    errors = []
+    warnings = []
+    try:
+        port_names = _parse_ports('CORDIC.v')
+        tb_content = _read_file('CORDIC_tb.v')
+    except OSError as exc:
+        return [f"cannot read file: {exc}"], []
+
+    if port_names is None:
+        errors.append("CORDIC.v: could not find module port list")
+        return errors, warnings
+
+    # Tokenize the testbench once and use set lookups, instead of one
+    # full substring scan per port.  Matching whole identifiers also
+    # stops a port counting as connected just because its name happens
+    # to be a substring of an unrelated identifier.
+    tb_idents = frozenset(_IDENT_RE.findall(tb_content))
+    missing_connections = sorted(port_names - tb_idents)
+    if missing_connections:
+        warnings.append("CORDIC_tb.v: ports not referenced: "
+                        + ', '.join(missing_connections))
+
+    return errors, warnings
+
+
+def main():
+    all_errors = []
+    all_warnings = []
+
+    for filename in ('CORDIC.v', 'CORDIC_tb.v'):
+        errors, warnings = check_verilog_syntax(filename)
+        all_errors.extend(errors)
+        all_warnings.extend(warnings)
+
+    errors, warnings = check_module_interfaces()
+    all_errors.extend(errors)
+    all_warnings.extend(warnings)
+
+    for warning in all_warnings:
+        print(f"warning: {warning}")
+    for error in all_errors:
+        print(f"error: {error}")
+
+    if all_errors:
+        print(f"{len(all_errors)} error(s), {len(all_warnings)} warning(s)")
+        return 1
+    print(f"OK ({len(all_warnings)} warning(s))")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""Generate Verilog localparam constants for the CORDIC core.
+
+Emits the scaled arctan table, gain-compensation constant, angle bounds
+and the angle-reduction logic for one or more (ANGLE_WIDTH, ITERATIONS,
+WIDTH) configurations.  Run without arguments to print the default
+configuration sweep.
+"""
+
+import functools
+import math
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Powers of TWO_PI handled by the generated angle-reduction chain.
+_MAX_REDUCTION_POWER = 2
+
+# One link of the angle-reduction if/else chain; each instantiation
+# ends mid-line so the next link (or the tail) continues the chain.
+_REDUCTION_TEMPLATE = (
+    "if (temp_angle >= {amount}) begin  // >= {degrees:.0f} deg\n"
+    "        temp_angle <= temp_angle - {amount};\n"
+    "    end else if (temp_angle <= -{amount}) begin\n"
+    "        temp_angle <= temp_angle + {amount};\n"
+    "    end else "
+)
+_REDUCTION_TAIL = (
+    "begin\n"
+    "        temp_angle <= temp_angle;\n"
+    "    end\n"
+    "end"
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _atan_pow2(i):
+    """Return atan(2**-i) in radians, computed at most once per index.
+
+    Configurations differ only in iteration count and scaling, so every
+    sweep shares the common prefix of the table instead of recomputing
+    it per configuration.
+    """
+    return math.atan(2 ** -i)
+
+
+@functools.lru_cache(maxsize=None)
+def _gain_prefix(n):
+    """Return the CORDIC gain after *n* iterations.
+
+    Defined via the cached (n-1) prefix, so a sweep over several
+    iteration counts only ever evaluates each sqrt term once.
+    """
+    if n == 0:
+        return 1.0
+    return _gain_prefix(n - 1) * math.sqrt(1 + 2 ** (-2 * (n - 1)))
+
+
+def generate_cordic_constants(angle_width, iterations, width):
+    """Return the Verilog constants for one CORDIC configuration."""
+    angle_scale = (1 << angle_width) / (2 * math.pi)
+    coord_scale = 1 << (width - 2)
+    gain = _gain_prefix(iterations)
+    atans = [_atan_pow2(i) for i in range(iterations)]
+
+    # Build the hex format strings once per configuration; every
+    # constant line then reuses them instead of re-deriving the digit
+    # width and re-parsing a nested format spec.
+    afmt = f"{angle_width}'h{{:0{(angle_width + 3) // 4}X}}"
+    a1fmt = f"{angle_width + 1}'h{{:0{(angle_width + 4) // 4}X}}"
+    wfmt = f"{width}'h{{:0{(width + 3) // 4}X}}"
+
+    # Collect output in a list and join once, instead of one buffered
+    # write (and potential flush) per print call.
+    out = []
+    out.append(f"// CORDIC constants: ANGLE_WIDTH={angle_width}, "
+               f"ITERATIONS={iterations}, WIDTH={width}")
+    out.append(f"// gain = {gain:.10f}, 1/gain = {1 / gain:.10f}")
+    out.append(f"localparam ANGLE_WIDTH = {angle_width};")
+    out.append(f"localparam ITERATIONS  = {iterations};")
+    out.append(f"localparam WIDTH       = {width};")
+    out.append("")
+
+    half_pi_scaled = round(0.5 * math.pi * angle_scale)
+    pi_scaled = round(math.pi * angle_scale)
+    two_pi_scaled = round(2 * math.pi * angle_scale)
+    inv_gain_scaled = round(coord_scale / gain)
+
+    out.append(f"localparam [{angle_width - 1}:0] HALF_PI  = "
+               f"{afmt.format(half_pi_scaled)};")
+    out.append(f"localparam [{angle_width - 1}:0] PI       = "
+               f"{afmt.format(pi_scaled)};")
+    # TWO_PI needs one extra bit: the full circle is 2**ANGLE_WIDTH.
+    out.append(f"localparam [{angle_width}:0] TWO_PI   = "
+               f"{a1fmt.format(two_pi_scaled)};")
+    out.append(f"localparam [{width - 1}:0] INV_GAIN = "
+               f"{wfmt.format(inv_gain_scaled)};")
+    out.append("")
+
+    out.append("// arctan table")
+    for i, atan in enumerate(atans):
+        scaled = round(atan * angle_scale)
+        degrees = math.degrees(atan)
+        out.append(f"localparam [{angle_width - 1}:0] ATAN_{i:02d} = "
+                   f"{afmt.format(scaled)};"
+                   f"  // atan(2^-{i}) = {degrees:.6f} deg")
+    out.append("")
+
+    out.append("// reduce temp_angle into [-PI, PI)")
+    chain = ''.join(
+        _REDUCTION_TEMPLATE.format(
+            amount=f"(TWO_PI << {power})" if power else "TWO_PI",
+            degrees=(2 ** (power + 1)) * 180)
+        for power in range(_MAX_REDUCTION_POWER, -1, -1))
+    out.append("always @* begin\n    " + chain + _REDUCTION_TAIL)
+
+    return '\n'.join(out)
+
+
+def generate_test_module(angle_width, iterations, width):
+    """Return a smoke-test module instantiating one configuration."""
+    name = f"CORDIC_test_a{angle_width}_i{iterations}_w{width}"
+    out = [
+        f"module {name};",
+        "    reg clk = 0, rst = 1, start = 0;",
+        f"    reg signed [{angle_width - 1}:0] angle_in = 0;",
+        f"    wire signed [{width - 1}:0] x_out, y_out;",
+        "    wire done;",
+        "",
+        f"    CORDIC #(.WIDTH({width}), .ANGLE_WIDTH({angle_width}), "
+        f".ITERATIONS({iterations})) dut (",
+        "        .clk(clk), .rst(rst), .start(start),",
+        "        .angle_in(angle_in),",
+        "        .x_out(x_out), .y_out(y_out), .done(done)",
+        "    );",
+        "",
+        "    always #5 clk = ~clk;",
+        "endmodule",
+    ]
+    return '\n'.join(out)
+
+
+def _gen_one(config):
+    """Generate the full output block for one configuration tuple."""
+    angle_width, iterations, width = config
+    return (generate_cordic_constants(angle_width, iterations, width)
+            + '\n\n'
+            + generate_test_module(angle_width, iterations, width))
+
+
+def main():
+    configs = [
+        (16, 12, 16),
+        (24, 15, 16),
+        (32, 15, 16),
+        (40, 18, 20),
+        (48, 20, 24),
+    ]
+    # The configurations share no state, so fan them out across worker
+    # processes and print the buffered results in sweep order.
+    with ProcessPoolExecutor() as executor:
+        chunks = list(executor.map(_gen_one, configs))
+    sys.stdout.write('\n\n'.join(chunks) + '\n')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())